@@ -0,0 +1,151 @@
+import sys
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import NamedTuple, Optional, Tuple
+
+from scores import FrameStats
+
+Position = Tuple[int, int]
+DIRECTIONS = [(1, 0), (0, 1), (-1, 0), (0, -1)]
+
+
+class BoardView(NamedTuple):
+    """Read-only copy of the board handed to a bot; safe to pickle to another process."""
+    width: int
+    height: int
+    snake: Tuple[Position, ...]  # Head first
+    direction: Position
+    food: Position
+    score: int
+    walls: Optional[bytes] = None  # Level wall bits, see level.py
+    portals: Tuple[Tuple[Position, Position], ...] = ()
+
+    def is_wall(self, pos: Position) -> bool:
+        if self.walls is None:
+            return False
+        i = pos[1] * self.width + pos[0]
+        return bool(self.walls[i >> 3] >> (i & 7) & 1)
+
+    def step(self, pos: Position, direction: Position) -> Position:
+        new = ((pos[0] + direction[0]) % self.width, (pos[1] + direction[1]) % self.height)
+        for a, b in self.portals:
+            if new == a:
+                return b
+            if new == b:
+                return a
+        return new
+
+
+class Bot:
+    """Plugin interface: decide() gets a BoardView and returns a direction, or None to keep going."""
+    name = 'bot'
+
+    def decide(self, view: BoardView) -> Optional[Position]:
+        raise NotImplementedError
+
+
+class GreedyBot(Bot):
+    """Heads for the food along the torus, avoiding cells that kill it next move."""
+    name = 'greedy'
+
+    def decide(self, view: BoardView) -> Optional[Position]:
+        head = view.snake[0]
+        body = set(view.snake[:-1])  # The tail moves out of the way
+        best = None
+        for direction in DIRECTIONS:
+            if direction == (-view.direction[0], -view.direction[1]) and len(view.snake) > 1:
+                continue
+            new = view.step(head, direction)
+            if new in body or view.is_wall(new):
+                continue
+            dx = abs(new[0] - view.food[0])
+            dy = abs(new[1] - view.food[1])
+            distance = min(dx, view.width - dx) + min(dy, view.height - dy)
+            if best is None or distance < best[0]:
+                best = (distance, direction)
+        return best[1] if best else None
+
+
+BOTS = {bot.name: bot for bot in (GreedyBot,)}
+
+
+def _timed_decide(bot: Bot, view: BoardView):
+    # Runs in the pool; perf_counter is monotonic across processes on Linux
+    return bot.decide(view), time.perf_counter()
+
+
+class BotRunner:
+    """Runs a bot off the main loop; a decision must arrive before the next move.
+
+    request() is called right after every move with the new board; poll() is
+    called every frame and returns the decision once it is ready. Anything
+    not picked up before the following move counts as a missed deadline and
+    the snake keeps its direction.
+    """
+
+    def __init__(self, bot: Bot, executor: Executor = None):
+        self.bot = bot
+        if executor is None and sys.platform != 'emscripten':
+            executor = ThreadPoolExecutor(max_workers=1)
+        self.executor = executor  # None decides inline, for the threadless web build
+        self.future = None
+        self.submitted_at = 0.0
+        self.decisions = 0
+        self.missed = 0
+        self.latency = FrameStats()  # Milliseconds from request to decision
+
+    def request(self, view: BoardView):
+        if self.future is not None:
+            self.missed += 1
+            self.future.cancel()
+        self.submitted_at = time.perf_counter()
+        if self.executor is None:
+            self.future = _InlineResult(_timed_decide(self.bot, view))
+        else:
+            self.future = self.executor.submit(_timed_decide, self.bot, view)
+
+    def poll(self) -> Optional[Position]:
+        if self.future is None or not self.future.done():
+            return None
+        future, self.future = self.future, None
+        if future.cancelled():
+            return None
+        direction, finished_at = future.result()
+        self.decisions += 1
+        self.latency.add((finished_at - self.submitted_at) * 1000)
+        return direction
+
+    def cancel(self):
+        if self.future is not None:
+            self.future.cancel()
+            self.future = None
+
+    def stats(self) -> dict:
+        return {
+            'bot': self.bot.name,
+            'decisions': self.decisions,
+            'missed': self.missed,
+            'latency_ms': self.latency.summary(),
+        }
+
+    def close(self):
+        self.cancel()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class _InlineResult:
+    def __init__(self, result):
+        self.result_value = result
+
+    def done(self) -> bool:
+        return True
+
+    def cancelled(self) -> bool:
+        return False
+
+    def cancel(self):
+        pass
+
+    def result(self):
+        return self.result_value
@@ -0,0 +1,146 @@
+import argparse
+import collections
+import multiprocessing
+import os
+import shutil
+import subprocess
+from typing import List, Tuple
+
+# Render offscreen; must be set before pygame is initialised by game.py
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from game import Game, WINDOW_WIDTH, WINDOW_HEIGHT
+from replay import Replay
+from level import Level
+
+CHUNK_FRAMES = 30  # Frames rendered per pool task
+VIDEO_FPS = 60
+
+_worker_game = None
+
+
+def replay_game(replay: Replay) -> Game:
+    game = _worker_game or Game(record=False)
+    if replay.level and (game.level is None or game.level.path != replay.level):
+        game.level = Level.load(replay.level)
+    elif not replay.level:
+        game.level = None
+    game.speed_slider.value = replay.base_speed
+    game.start_game(replay.seed)
+    return game
+
+
+def step(game: Game, replay: Replay, frame: int):
+    for kind, value in replay.events_at(frame):
+        game.apply_input(kind, value)
+    game.update()
+
+
+def render_chunk(replay: Replay, start: int, end: int, scale: float = 1.0) -> List[bytes]:
+    # Each chunk re-simulates from the seed without drawing, which is far
+    # cheaper than rendering and keeps chunks independent of each other
+    game = replay_game(replay)
+    for frame in range(start):
+        step(game, replay, frame)
+
+    size = (int(WINDOW_WIDTH * scale), int(WINDOW_HEIGHT * scale))
+    frames = []
+    for frame in range(start, end):
+        step(game, replay, frame)
+        game.draw()
+        surface = game.screen
+        if scale != 1.0:
+            surface = pygame.transform.smoothscale(surface, size)
+        frames.append(pygame.image.tobytes(surface, 'RGB'))
+    return frames
+
+
+def _init_worker():
+    global _worker_game
+    _worker_game = Game(record=False)
+
+
+def _render_task(args):
+    return render_chunk(*args)
+
+
+class FfmpegWriter:
+    """Streams raw RGB frames into ffmpeg; the container follows the file extension."""
+
+    def __init__(self, path: str, size: Tuple[int, int], fps: int = VIDEO_FPS):
+        if shutil.which('ffmpeg') is None:
+            raise RuntimeError('ffmpeg not found; write to a directory to get PNG frames instead')
+        cmd = ['ffmpeg', '-y', '-loglevel', 'error',
+               '-f', 'rawvideo', '-pix_fmt', 'rgb24',
+               '-s', f'{size[0]}x{size[1]}', '-r', str(fps), '-i', '-']
+        if not path.endswith('.gif'):
+            cmd += ['-pix_fmt', 'yuv420p']
+        self.process = subprocess.Popen(cmd + [path], stdin=subprocess.PIPE)
+
+    def write(self, frame: bytes):
+        self.process.stdin.write(frame)
+
+    def close(self):
+        self.process.stdin.close()
+        if self.process.wait() != 0:
+            raise RuntimeError('ffmpeg exited with an error')
+
+
+class PngWriter:
+    def __init__(self, path: str, size: Tuple[int, int]):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.size = size
+        self.count = 0
+
+    def write(self, frame: bytes):
+        surface = pygame.image.frombytes(frame, self.size, 'RGB')
+        pygame.image.save(surface, os.path.join(self.path, f'frame_{self.count:06d}.png'))
+        self.count += 1
+
+    def close(self):
+        pass
+
+
+def export_replay(replay: Replay, output: str, processes: int = None,
+                  chunk_frames: int = CHUNK_FRAMES, scale: float = 1.0):
+    size = (int(WINDOW_WIDTH * scale), int(WINDOW_HEIGHT * scale))
+    if os.path.splitext(output)[1]:
+        writer = FfmpegWriter(output, size)
+    else:
+        writer = PngWriter(output, size)
+
+    processes = processes or os.cpu_count() or 1
+    chunks = [(replay, start, min(start + chunk_frames, replay.frames), scale)
+              for start in range(0, replay.frames, chunk_frames)]
+
+    # Keep only a couple of chunks per worker in flight so memory stays
+    # bounded by the window, not by the length of the game
+    pending = collections.deque()
+    with multiprocessing.Pool(processes, initializer=_init_worker) as pool:
+        for chunk in chunks:
+            pending.append(pool.apply_async(_render_task, (chunk,)))
+            if len(pending) >= processes * 2:
+                for frame in pending.popleft().get():
+                    writer.write(frame)
+        while pending:
+            for frame in pending.popleft().get():
+                writer.write(frame)
+    writer.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Render a recorded game to video, GIF or PNG frames')
+    parser.add_argument('replay', help='replay JSON written to the replays directory')
+    parser.add_argument('output', help='.mp4/.gif/... (needs ffmpeg) or a directory for PNG frames')
+    parser.add_argument('--processes', type=int, default=None)
+    parser.add_argument('--chunk-frames', type=int, default=CHUNK_FRAMES)
+    parser.add_argument('--scale', type=float, default=1.0)
+    args = parser.parse_args()
+    export_replay(Replay.load(args.replay), args.output, args.processes,
+                  args.chunk_frames, args.scale)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,15 @@
+import argparse
 import pygame
 import sys
 import random
 import os
 from typing import Tuple, List
+from scores import FrameStats, open_score_store
+from replay import Replay, REPLAY_DIR
+from rewind import RewindBuffer
+from level import Level
+from quality import QualityGovernor
+from bot import BoardView, BotRunner
 
 # Initialize Pygame
 pygame.init()
@@ -14,6 +21,7 @@ GRID_SIZE = 20
 GRID_WIDTH = WINDOW_WIDTH // GRID_SIZE
 GRID_HEIGHT = WINDOW_HEIGHT // GRID_SIZE
 SPEED = 10  # Controls game speed (moves per second)
+REWIND_KEY = pygame.K_BACKSPACE  # Hold to step back through recent ticks
 
 # Colors
 BLACK = (0, 0, 0)
@@ -127,7 +135,8 @@ class Slider:
         return False
 
 class Snake:
-    def __init__(self):
+    def __init__(self, level: Level = None):
+        self.level = level
         self.length = 3
         self.positions = [(GRID_WIDTH // 2, GRID_HEIGHT // 2)]
         self.direction = (1, 0)  # Start moving right
@@ -142,6 +151,10 @@ class Snake:
         cur = self.get_head_position()
         x, y = self.direction
         new = ((cur[0] + x) % GRID_WIDTH, (cur[1] + y) % GRID_HEIGHT)
+        if self.level:
+            new = self.level.portals.get(new, new)
+            if self.level.is_wall(new):
+                return False  # Game over
         if new in self.positions[3:]:
             return False  # Game over
         self.positions.insert(0, new)
@@ -168,7 +181,8 @@ class Snake:
         self.color_offset = (self.color_offset + self.cycle_speed) % len(SNAKE_COLORS)
 
 class Food:
-    def __init__(self):
+    def __init__(self, level: Level = None):
+        self.level = level
         self.position = (0, 0)
         self.color = RED
         self.randomize_position([])
@@ -178,7 +192,8 @@ class Food:
         while True:
             self.position = (random.randint(0, GRID_WIDTH-1),
                            random.randint(0, GRID_HEIGHT-1))
-            if self.position not in snake_positions:
+            if self.position not in snake_positions and \
+               not (self.level and self.level.is_blocked(self.position)):
                 break
 
 # Theme definitions
@@ -214,7 +229,11 @@ THEMES = {
 }
 
 class Game:
-    def __init__(self):
+    def __init__(self, record: bool = True, level: Level = None, spectator_name: str = None,
+                 bot_runner: BotRunner = None):
+        if level and (level.width, level.height) != (GRID_WIDTH, GRID_HEIGHT):
+            raise ValueError(f'Level is {level.width}x{level.height}, board is {GRID_WIDTH}x{GRID_HEIGHT}')
+        self.level = level
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption('Snake Game')
         self.clock = pygame.time.Clock()
@@ -249,6 +268,120 @@ class Game:
         ]
         self.settings_focus_index = 0  # Index of currently focused element
 
+        # High scores and per-game frame time summaries
+        self.score_store = open_score_store()
+        self.frame_stats = FrameStats()
+        self.game_start_time = 0
+
+        # Input recording for replays; off for headless re-runs of a replay
+        self.record = record
+        self.replay = None
+        self.frame_index = 0
+
+        # Rewind while REWIND_KEY is held
+        self.rewind_buffer = RewindBuffer()
+        self.rewinding = False
+
+        # Steps render quality down when frames run over budget
+        self.quality = QualityGovernor(1000 / self.fps)
+        self.osd_surface = None
+        self.osd_frame = 0
+
+        # Layers and fonts reused across frames instead of rebuilt each draw
+        self.grid_layers = {}
+        self.fonts = {}
+
+        # Optional bot steering the snake, decided off the main loop
+        self.bot_runner = bot_runner
+
+        # Frames for local spectator processes, see spectator.py
+        self.publisher = None
+        if spectator_name:
+            # Imported here since shared memory isn't available on the web build
+            from spectator import FramePublisher
+            self.publisher = FramePublisher((WINDOW_WIDTH, WINDOW_HEIGHT), spectator_name)
+
+    def start_game(self, seed: int = None):
+        # Seed the shared RNG so a replay of the same inputs is deterministic
+        if seed is None:
+            seed = random.getrandbits(32)
+        random.seed(seed)
+        self.state = 'playing'
+        self.game_over = False
+        self.score = 0
+        self.move_timer = 0
+        self.game_speed = self.speed_slider.value
+        self.current_theme = random.choice(self.theme_list)
+        self.theme_index = self.theme_list.index(self.current_theme)
+        self.snake = Snake(self.level)
+        self.food = Food(self.level)
+        self.game_start_time = pygame.time.get_ticks()
+        self.frame_stats.reset()
+        self.frame_index = 0
+        self.osd_surface = None
+        self.replay = Replay(seed, self.speed_slider.value,
+                             self.level.path if self.level else None)
+        self.rewind_buffer.reset(self)
+        if self.bot_runner:
+            self.bot_runner.cancel()
+            self.bot_runner.request(self.board_view())
+
+    def perform_input(self, kind: str, value):
+        if kind == 'turn':
+            self.snake.turn(value)
+        elif kind == 'theme':
+            self.cycle_theme(value)
+
+    def apply_input(self, kind: str, value):
+        self.perform_input(kind, value)
+        self.replay.add(self.frame_index, kind, value)
+        self.rewind_buffer.add_input(kind, value)
+
+    def board_view(self) -> BoardView:
+        return BoardView(GRID_WIDTH, GRID_HEIGHT, tuple(self.snake.positions),
+                         self.snake.direction, self.food.position, self.score,
+                         bytes(self.level.walls) if self.level else None,
+                         tuple(self.level.portal_pairs) if self.level else ())
+
+    def snapshot(self) -> dict:
+        return {
+            'positions': list(self.snake.positions),
+            'length': self.snake.length,
+            'direction': self.snake.direction,
+            'color_offset': self.snake.color_offset,
+            'food': self.food.position,
+            'score': self.score,
+            'game_speed': self.game_speed,
+            'move_timer': self.move_timer,
+            'theme_index': self.theme_index,
+            'frame_index': self.frame_index,
+            'random': random.getstate(),
+        }
+
+    def restore(self, state: dict):
+        self.snake.positions = list(state['positions'])
+        self.snake.length = state['length']
+        self.snake.direction = state['direction']
+        self.snake.color_offset = state['color_offset']
+        self.food.position = state['food']
+        self.score = state['score']
+        self.game_speed = state['game_speed']
+        self.move_timer = state['move_timer']
+        self.theme_index = state['theme_index']
+        self.current_theme = self.theme_list[self.theme_index]
+        self.frame_index = state['frame_index']
+        random.setstate(state['random'])
+        self.game_over = False
+
+    def rewind(self, ticks: int = 1) -> int:
+        rewound = self.rewind_buffer.rewind(self, ticks)
+        if rewound:
+            self.replay.truncate(self.frame_index)
+            if self.bot_runner:
+                self.bot_runner.cancel()
+                self.bot_runner.request(self.board_view())
+        return rewound
+
     def cycle_theme(self, direction: int):
         self.theme_index = (self.theme_index + direction) % len(self.theme_list)
         self.current_theme = self.theme_list[self.theme_index]
@@ -265,67 +398,82 @@ class Game:
                     self.state = 'menu'
                     return True
                 elif event.key == pygame.K_UP:
-                    self.snake.turn((0, -1))
+                    self.apply_input('turn', (0, -1))
                 elif event.key == pygame.K_DOWN:
-                    self.snake.turn((0, 1))
+                    self.apply_input('turn', (0, 1))
                 elif event.key == pygame.K_LEFT:
-                    self.snake.turn((-1, 0))
+                    self.apply_input('turn', (-1, 0))
                 elif event.key == pygame.K_RIGHT:
-                    self.snake.turn((1, 0))
+                    self.apply_input('turn', (1, 0))
                 elif event.key == pygame.K_LEFTBRACKET:
-                    self.cycle_theme(-1)
+                    self.apply_input('theme', -1)
                 elif event.key == pygame.K_RIGHTBRACKET:
-                    self.cycle_theme(1)
+                    self.apply_input('theme', 1)
+        self.rewinding = pygame.key.get_pressed()[REWIND_KEY]
         return True
 
+    def get_font(self, size: int) -> pygame.font.Font:
+        if size not in self.fonts:
+            self.fonts[size] = pygame.font.Font(os.path.join('assets', 'fonts', 'PressStart2P-Regular.ttf'), size)
+        return self.fonts[size]
+
     def draw_grid(self, screen, theme):
-        grid_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        
-        # Draw vertical grid lines
-        for x in range(0, WINDOW_WIDTH, GRID_SIZE):
-            for y in range(0, WINDOW_HEIGHT, 2):
-                if y % 4 == 0:
-                    pygame.draw.line(grid_surface, theme['grid'], (x, y), (x, y + 1))
-        
-        # Draw horizontal grid lines
-        for y in range(0, WINDOW_HEIGHT, GRID_SIZE):
-            for x in range(0, WINDOW_WIDTH, 2):
-                if x % 4 == 0:
-                    pygame.draw.line(grid_surface, theme['grid'], (x, y), (x + 1, y))
+        # Rendered once per grid color, then blitted every frame
+        if theme['grid'] not in self.grid_layers:
+            grid_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+            
+            # Draw vertical grid lines
+            for x in range(0, WINDOW_WIDTH, GRID_SIZE):
+                for y in range(0, WINDOW_HEIGHT, 2):
+                    if y % 4 == 0:
+                        pygame.draw.line(grid_surface, theme['grid'], (x, y), (x, y + 1))
+            
+            # Draw horizontal grid lines
+            for y in range(0, WINDOW_HEIGHT, GRID_SIZE):
+                for x in range(0, WINDOW_WIDTH, 2):
+                    if x % 4 == 0:
+                        pygame.draw.line(grid_surface, theme['grid'], (x, y), (x + 1, y))
+            self.grid_layers[theme['grid']] = grid_surface
         
-        screen.blit(grid_surface, (0, 0))
+        screen.blit(self.grid_layers[theme['grid']], (0, 0))
 
     def draw_osd(self, screen, theme):
-        font_path = os.path.join('assets', 'fonts', 'PressStart2P-Regular.ttf')
-        length_font = pygame.font.Font(font_path, 16)
-        speed_font = pygame.font.Font(font_path, 12)  # Smaller font for speed
-        
-        osd_surface = pygame.Surface((400, 40), pygame.SRCALPHA)  # Increased height for two lines
-        pygame.draw.rect(osd_surface, theme['osd_bg'], (0, 0, 400, 40))
-        
-        # Render length text
-        length_text = length_font.render(f'Length: {self.snake.length}', True, theme['grid'])
-        length_rect = length_text.get_rect(center=(200, 10))
-        osd_surface.blit(length_text, length_rect)
-        
-        # Render speed text with smaller font below length
-        speed_text = speed_font.render(f'Speed: {self.game_speed}', True, theme['grid'])
-        speed_rect = speed_text.get_rect(center=(200, 28))  # Positioned below length text
-        osd_surface.blit(speed_text, speed_rect)
+        # Re-rendered every osd_interval frames, the cached surface in between
+        self.osd_frame += 1
+        if self.osd_surface is None or self.osd_frame >= self.quality.osd_interval:
+            self.osd_frame = 0
+            length_font = self.get_font(16)
+            speed_font = self.get_font(12)  # Smaller font for speed
+            
+            osd_surface = pygame.Surface((400, 40), pygame.SRCALPHA)  # Increased height for two lines
+            pygame.draw.rect(osd_surface, theme['osd_bg'], (0, 0, 400, 40))
+            
+            # Render length text
+            length_text = length_font.render(f'Length: {self.snake.length}', True, theme['grid'])
+            length_rect = length_text.get_rect(center=(200, 10))
+            osd_surface.blit(length_text, length_rect)
+            
+            # Render speed text with smaller font below length
+            speed_text = speed_font.render(f'Speed: {self.game_speed}', True, theme['grid'])
+            speed_rect = speed_text.get_rect(center=(200, 28))  # Positioned below length text
+            osd_surface.blit(speed_text, speed_rect)
+            self.osd_surface = osd_surface
         
-        screen.blit(osd_surface, (WINDOW_WIDTH//2 - 200, 10))
+        screen.blit(self.osd_surface, (WINDOW_WIDTH//2 - 200, 10))
 
-    def draw_snake(self, screen):
+    def draw_snake(self, screen, rounded: bool = True):
+        # Without rounding, segments are plain squares and connectors are skipped
+        border_radius = 5 if rounded else 0
         for i, pos in enumerate(self.snake.positions):
             color_index = self.snake.get_color_index(i)
             
             # Draw main segment body
             rect = pygame.Rect(pos[0] * GRID_SIZE, pos[1] * GRID_SIZE,
                              GRID_SIZE-1, GRID_SIZE-1)
-            pygame.draw.rect(screen, SNAKE_COLORS[color_index], rect, border_radius=5)
+            pygame.draw.rect(screen, SNAKE_COLORS[color_index], rect, border_radius=border_radius)
             
             # Draw rounded connection if not the last segment
-            if i < len(self.snake.positions) - 1:
+            if rounded and i < len(self.snake.positions) - 1:
                 next_pos = self.snake.positions[i + 1]
                 dx = next_pos[0] - pos[0]
                 dy = next_pos[1] - pos[1]
@@ -353,9 +501,15 @@ class Game:
     def draw_game_screen(self):
         theme = THEMES[self.current_theme]
         self.screen.fill(theme['background'])
-        self.draw_grid(self.screen, theme)
+        if self.quality.show_grid:
+            self.draw_grid(self.screen, theme)
+
+        # Walls and portals come from a layer rendered once per theme
+        if self.level:
+            self.screen.blit(self.level.wall_layer(theme['grid'][:3], theme['osd_text'], GRID_SIZE), (0, 0))
+
         self.draw_osd(self.screen, theme)
-        self.draw_snake(self.screen)
+        self.draw_snake(self.screen, self.quality.rounded_snake)
 
         # Draw food
         rect = pygame.Rect(self.food.position[0] * GRID_SIZE,
@@ -364,7 +518,7 @@ class Game:
         pygame.draw.rect(self.screen, self.food.color, rect, border_radius=5)
 
         if self.game_over:
-            font = pygame.font.Font(os.path.join('assets', 'fonts', 'PressStart2P-Regular.ttf'), 36)
+            font = self.get_font(36)
             text = font.render('Game Over! Press ESC for Menu', True, WHITE)
             text_rect = text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2))
             self.screen.blit(text, text_rect)
@@ -389,41 +543,18 @@ class Game:
         self.start_button.draw(self.screen)
         self.settings_button.draw(self.screen)
 
-    def draw(self):
-        if self.state == 'playing':
-            self.draw_game_screen()
-        elif self.state == 'settings':
-            self.draw_settings_screen()
-        else:  # menu state
-            self.draw_menu_screen()
-        pygame.display.flip()
-
-    def update(self):
-        if self.state != 'playing' or self.game_over:
+    def record_game(self):
+        if not self.record:
             return
+        self.replay.frames = self.frame_index
+        if sys.platform != 'emscripten':
+            os.makedirs(REPLAY_DIR, exist_ok=True)
+            self.replay.save(os.path.join(REPLAY_DIR, f'{self.replay.seed}.json'))
 
-        # Update game speed based on snake length
-        base_speed = self.speed_slider.value
-        length_bonus = self.snake.length // 10
-        new_speed = base_speed + length_bonus
-        
-        # Cycle theme when speed increases
-        if new_speed > self.game_speed:
-            self.cycle_theme(1)
-            
-        self.game_speed = new_speed
-
-        self.move_timer += 1
-        if self.move_timer >= self.fps / self.game_speed:
-            self.move_timer = 0
-            if not self.snake.move():
-                self.game_over = True
-                return
-
-            if self.snake.get_head_position() == self.food.position:
-                self.snake.length += 1
-                self.score += 1
-                self.food.randomize_position(self.snake.positions)
+        # Queued to the store's writer so a game over never stalls a frame
+        duration = (pygame.time.get_ticks() - self.game_start_time) / 1000
+        self.score_store.record_game(self.score, self.snake.length, duration,
+                                     self.frame_stats.summary())
 
     def handle_menu_events(self):
         for event in pygame.event.get():
@@ -446,15 +577,7 @@ class Game:
                 elif event.key == pygame.K_RETURN:  # Handle Enter key
                     if self.state == 'menu':
                         if self.start_button.active:
-                            self.state = 'playing'
-                            self.game_over = False
-                            self.score = 0
-                            self.move_timer = 0
-                            self.game_speed = self.speed_slider.value
-                            self.current_theme = random.choice(self.theme_list)
-                            self.theme_index = self.theme_list.index(self.current_theme)
-                            self.snake = Snake()
-                            self.food = Food()
+                            self.start_game()
                             return True
                         elif self.settings_button.active:
                             self.state = 'settings'
@@ -497,11 +620,7 @@ class Game:
             # Handle button events based on current state
             if self.state == 'menu':
                 if self.start_button.handle_event(event):
-                    self.state = 'playing'
-                    self.current_theme = random.choice(self.theme_list)
-                    self.theme_index = self.theme_list.index(self.current_theme)
-                    self.snake = Snake()
-                    self.food = Food()
+                    self.start_game()
                     return True
                 elif self.settings_button.handle_event(event):
                     self.state = 'settings'
@@ -514,6 +633,11 @@ class Game:
 
         return True
 
+    def present(self):
+        if self.publisher:
+            self.publisher.publish(self.screen)
+        pygame.display.flip()
+
     def draw_menu(self):
         self.screen.fill(BLACK)
         if self.state == 'menu':
@@ -528,11 +652,34 @@ class Game:
             self.screen.blit(text, text_rect)
             self.speed_slider.draw(self.screen)
 
-        pygame.display.flip()
+        self.present()
 
     def update(self):
-        if self.state != 'playing' or self.game_over:
+        if self.state != 'playing':
+            return
+        if self.rewinding:
+            self.rewind(1)
             return
+        if self.game_over:
+            return
+
+        if self.bot_runner:
+            direction = self.bot_runner.poll()
+            if direction:
+                self.apply_input('turn', direction)
+
+        self.frame_stats.add(self.clock.get_time())
+        self.step()
+        self.rewind_buffer.push(self)
+        if self.game_over:
+            self.record_game()
+        elif self.bot_runner and self.move_timer == 0:
+            # Just moved: ask for the decision due by the next move
+            self.bot_runner.request(self.board_view())
+
+    def step(self):
+        # Advance the game by one tick; deterministic given the RNG state,
+        # so replays and rewinds can re-run it
 
         # Update game speed based on snake length
         base_speed = self.speed_slider.value
@@ -545,6 +692,8 @@ class Game:
             
         self.game_speed = new_speed
 
+        self.frame_index += 1
+
         self.move_timer += 1
         if self.move_timer >= self.fps / self.game_speed:
             self.move_timer = 0
@@ -562,103 +711,10 @@ class Game:
             self.draw_menu()
             return
 
-        theme = THEMES[self.current_theme]
-        self.screen.fill(theme['background'])
-        
-        # Draw grid with semi-transparent dotted lines
-        grid_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        
-        # Draw vertical grid lines
-        for x in range(0, WINDOW_WIDTH, GRID_SIZE):
-            for y in range(0, WINDOW_HEIGHT, 2):  # Draw dotted lines
-                if y % 4 == 0:  # Skip every other dot to create dotted effect
-                    pygame.draw.line(grid_surface, theme['grid'], (x, y), (x, y + 1))
-        
-        # Draw horizontal grid lines
-        for y in range(0, WINDOW_HEIGHT, GRID_SIZE):
-            for x in range(0, WINDOW_WIDTH, 2):  # Draw dotted lines
-                if x % 4 == 0:  # Skip every other dot to create dotted effect
-                    pygame.draw.line(grid_surface, theme['grid'], (x, y), (x + 1, y))
-        
-        # Blit the grid surface onto the screen
-        self.screen.blit(grid_surface, (0, 0))
-        
-        # Draw snake length and speed with semi-transparent background
-        # Load custom font for OSD
-        font_path = os.path.join('assets', 'fonts', 'PressStart2P-Regular.ttf')
-        length_font = pygame.font.Font(font_path, 16)
-        speed_font = pygame.font.Font(font_path, 12)  # Smaller font for speed
-        
-        # Create a surface for the OSD with alpha channel
-        osd_surface = pygame.Surface((400, 40), pygame.SRCALPHA)  # Increased height for two lines
-        pygame.draw.rect(osd_surface, theme['osd_bg'], (0, 0, 400, 40))
-        
-        # Render length text
-        length_text = length_font.render(f'Length: {self.snake.length}', True, theme['grid'])
-        length_rect = length_text.get_rect(center=(200, 10))
-        osd_surface.blit(length_text, length_rect)
-        
-        # Render speed text
-        speed_text = speed_font.render(f'Speed: {self.game_speed}', True, theme['grid'])
-        speed_rect = speed_text.get_rect(center=(200, 28))
-        osd_surface.blit(speed_text, speed_rect)
-        
-        # Center OSD surface at the top of the screen
-        self.screen.blit(osd_surface, (WINDOW_WIDTH//2 - 200, 10))
-        
-        # Draw snake segments with rounded corners
-        for i, pos in enumerate(self.snake.positions):
-            color_index = self.snake.get_color_index(i)
-            
-            # Draw main segment body
-            rect = pygame.Rect(pos[0] * GRID_SIZE, pos[1] * GRID_SIZE,
-                             GRID_SIZE-1, GRID_SIZE-1)
-            pygame.draw.rect(self.screen, SNAKE_COLORS[color_index], rect, border_radius=5)
-            
-            # Draw rounded connection if not the last segment
-            if i < len(self.snake.positions) - 1:
-                next_pos = self.snake.positions[i + 1]
-                # Calculate direction between current and next segment
-                dx = next_pos[0] - pos[0]
-                dy = next_pos[1] - pos[1]
-                
-                # Handle wrap-around cases
-                if abs(dx) > 1:
-                    dx = -1 if dx > 0 else 1
-                if abs(dy) > 1:
-                    dy = -1 if dy > 0 else 1
-                
-                # Draw connection rectangle with rounded corners
-                if dx != 0:  # Horizontal connection
-                    connect_rect = pygame.Rect(
-                        min(pos[0], pos[0] + dx) * GRID_SIZE + GRID_SIZE//2,
-                        pos[1] * GRID_SIZE,
-                        abs(dx) * GRID_SIZE,
-                        GRID_SIZE-1
-                    )
-                    pygame.draw.rect(self.screen, SNAKE_COLORS[color_index], connect_rect, border_radius=5)
-                elif dy != 0:  # Vertical connection
-                    connect_rect = pygame.Rect(
-                        pos[0] * GRID_SIZE,
-                        min(pos[1], pos[1] + dy) * GRID_SIZE + GRID_SIZE//2,
-                        GRID_SIZE-1,
-                        abs(dy) * GRID_SIZE
-                    )
-                    pygame.draw.rect(self.screen, SNAKE_COLORS[color_index], connect_rect, border_radius=5)
-
-        # Draw food
-        rect = pygame.Rect(self.food.position[0] * GRID_SIZE,
-                         self.food.position[1] * GRID_SIZE,
-                         GRID_SIZE-1, GRID_SIZE-1)
-        pygame.draw.rect(self.screen, self.food.color, rect, border_radius=5)
-
-        if self.game_over:
-            font = pygame.font.Font(os.path.join('assets', 'fonts', 'PressStart2P-Regular.ttf'), 36)
-            text = font.render('Game Over! Press ESC for Menu', True, WHITE)
-            text_rect = text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2))
-            self.screen.blit(text, text_rect)
-
-        pygame.display.flip()
+        # Work time of the previous frame, excluding the clock's sleep
+        self.quality.add(self.clock.get_rawtime())
+        self.draw_game_screen()
+        self.present()
 
     def run(self):
         running = True
@@ -668,9 +724,30 @@ class Game:
             self.draw()
             self.clock.tick(self.fps)
 
+        self.score_store.close()
+        if self.publisher:
+            self.publisher.close()
+        if self.bot_runner:
+            self.bot_runner.close()
         pygame.quit()
         sys.exit()
 
 if __name__ == '__main__':
-    game = Game()
+    from concurrent.futures import ProcessPoolExecutor
+    from bot import BOTS
+    from spectator import SPECTATOR_NAME
+    parser = argparse.ArgumentParser(description='Snake Game')
+    parser.add_argument('level', nargs='?', help='level file built with level.py')
+    parser.add_argument('--spectate', metavar='NAME', nargs='?', const=SPECTATOR_NAME,
+                        help='publish frames for spectator.py viewers')
+    parser.add_argument('--bot', choices=sorted(BOTS), help='let a bot steer the snake')
+    parser.add_argument('--bot-processes', action='store_true',
+                        help='run the bot in a separate process instead of a thread')
+    args = parser.parse_args()
+    bot_runner = None
+    if args.bot:
+        executor = ProcessPoolExecutor(max_workers=1) if args.bot_processes else None
+        bot_runner = BotRunner(BOTS[args.bot](), executor)
+    game = Game(level=Level.load(args.level) if args.level else None,
+                spectator_name=args.spectate, bot_runner=bot_runner)
     game.run()
\ No newline at end of file
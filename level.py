@@ -0,0 +1,125 @@
+import mmap
+import struct
+import sys
+from typing import Dict, Iterable, List, Tuple
+
+import pygame
+
+# File layout (little endian):
+#   header   magic, version, width, height, portal count
+#   walls    width * height bits, row-major, LSB first in each byte
+#   portals  portal count * (x1, y1, x2, y2)
+LEVEL_MAGIC = b'SNKL'
+LEVEL_VERSION = 1
+HEADER = struct.Struct('<4sB3xIII')
+PORTAL = struct.Struct('<IIII')
+
+Position = Tuple[int, int]
+
+
+class Level:
+    """Walls and portals on a fixed-size board.
+
+    The packed wall bits double as the collision bitmap, so a lookup is a
+    single byte index and a loaded file is used straight from the mmap.
+    """
+
+    def __init__(self, width: int, height: int, walls, portals: List[Tuple[Position, Position]]):
+        self.width = width
+        self.height = height
+        self.walls = walls
+        self.portal_pairs = portals
+        self.portals: Dict[Position, Position] = {}
+        for a, b in portals:
+            self.portals[a] = b
+            self.portals[b] = a
+        self.wall_layers = {}
+        self.path = None  # Set when loaded from a file
+
+    def is_wall(self, pos: Position) -> bool:
+        i = pos[1] * self.width + pos[0]
+        return bool(self.walls[i >> 3] >> (i & 7) & 1)
+
+    def is_blocked(self, pos: Position) -> bool:
+        # Cells food can't spawn on
+        return self.is_wall(pos) or pos in self.portals
+
+    @classmethod
+    def from_cells(cls, width: int, height: int, walls: Iterable[Position],
+                   portals: List[Tuple[Position, Position]] = ()) -> 'Level':
+        bits = bytearray((width * height + 7) // 8)
+        for x, y in walls:
+            i = y * width + x
+            bits[i >> 3] |= 1 << (i & 7)
+        return cls(width, height, bytes(bits), list(portals))
+
+    @classmethod
+    def from_text(cls, text: str) -> 'Level':
+        # '#' is a wall, a matching pair of letters is a portal, anything else is floor
+        rows = text.splitlines()
+        walls = []
+        ends = {}
+        for y, row in enumerate(rows):
+            for x, cell in enumerate(row):
+                if cell == '#':
+                    walls.append((x, y))
+                elif cell.isalpha():
+                    ends.setdefault(cell, []).append((x, y))
+        portals = [tuple(pair) for pair in ends.values() if len(pair) == 2]
+        return cls.from_cells(max(len(row) for row in rows), len(rows), walls, portals)
+
+    def save(self, path: str):
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(LEVEL_MAGIC, LEVEL_VERSION, self.width, self.height,
+                                len(self.portal_pairs)))
+            f.write(self.walls)
+            for (x1, y1), (x2, y2) in self.portal_pairs:
+                f.write(PORTAL.pack(x1, y1, x2, y2))
+
+    @classmethod
+    def load(cls, path: str) -> 'Level':
+        with open(path, 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, width, height, portal_count = HEADER.unpack_from(data, 0)
+        if magic != LEVEL_MAGIC or version != LEVEL_VERSION:
+            raise ValueError(f'{path} is not a level file')
+        walls_start = HEADER.size
+        walls_end = walls_start + (width * height + 7) // 8
+        portals = []
+        for n in range(portal_count):
+            x1, y1, x2, y2 = PORTAL.unpack_from(data, walls_end + n * PORTAL.size)
+            portals.append(((x1, y1), (x2, y2)))
+        level = cls(width, height, memoryview(data)[walls_start:walls_end], portals)
+        level.path = path
+        return level
+
+    def wall_layer(self, wall_color, portal_color, cell_size: int) -> pygame.Surface:
+        # Rendered once per color scheme, then blitted every frame
+        key = (tuple(wall_color), tuple(portal_color), cell_size)
+        if key not in self.wall_layers:
+            layer = pygame.Surface((self.width * cell_size, self.height * cell_size), pygame.SRCALPHA)
+            for y in range(self.height):
+                # Draw horizontal runs of wall as one rect each
+                x = 0
+                while x < self.width:
+                    if not self.is_wall((x, y)):
+                        x += 1
+                        continue
+                    start = x
+                    while x < self.width and self.is_wall((x, y)):
+                        x += 1
+                    pygame.draw.rect(layer, wall_color,
+                                     (start * cell_size, y * cell_size,
+                                      (x - start) * cell_size, cell_size))
+            for x, y in self.portals:
+                pygame.draw.rect(layer, portal_color,
+                                 (x * cell_size, y * cell_size, cell_size - 1, cell_size - 1),
+                                 2, border_radius=5)
+            self.wall_layers[key] = layer
+        return self.wall_layers[key]
+
+
+if __name__ == '__main__':
+    # python level.py level.txt level.lvl
+    with open(sys.argv[1]) as f:
+        Level.from_text(f.read()).save(sys.argv[2])
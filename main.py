@@ -15,6 +15,7 @@ async def main():
         # Add small delay for browser compatibility
         await asyncio.sleep(0)
 
+    game.score_store.close()
     pygame.quit()
 
 if __name__ == "__main__":
@@ -0,0 +1,67 @@
+from scores import FrameStats
+
+# Each level keeps the savings of the ones before it
+QUALITY_LEVELS = ['full', 'no_grid', 'flat_snake', 'slow_osd']
+SLOW_OSD_INTERVAL = 15  # Frames between OSD redraws at the lowest level
+
+DEGRADE_AFTER = 30   # Consecutive frames over budget before dropping a level
+RESTORE_AFTER = 180  # Consecutive frames with headroom before going back up
+HEADROOM = 0.6       # Fraction of the budget a frame must stay under to count as headroom
+
+
+class QualityGovernor:
+    """Steps render quality down when frames run over budget and back up with hysteresis.
+
+    Frames between HEADROOM * budget and the budget reset both counters, so
+    quality doesn't flap while frame times hover around the limit.
+    """
+
+    def __init__(self, budget_ms: float):
+        self.budget_ms = budget_ms
+        self.level = 0
+        self.over = 0
+        self.under = 0
+        self.changes = 0
+        self.frame_stats = FrameStats()
+
+    def add(self, frame_ms: float):
+        self.frame_stats.add(frame_ms)
+        if frame_ms > self.budget_ms:
+            self.over += 1
+            self.under = 0
+        elif frame_ms < self.budget_ms * HEADROOM:
+            self.under += 1
+            self.over = 0
+        else:
+            self.over = 0
+            self.under = 0
+
+        if self.over >= DEGRADE_AFTER and self.level < len(QUALITY_LEVELS) - 1:
+            self.level += 1
+            self.over = 0
+            self.changes += 1
+        elif self.under >= RESTORE_AFTER and self.level > 0:
+            self.level -= 1
+            self.under = 0
+            self.changes += 1
+
+    @property
+    def show_grid(self) -> bool:
+        return self.level < QUALITY_LEVELS.index('no_grid')
+
+    @property
+    def rounded_snake(self) -> bool:
+        return self.level < QUALITY_LEVELS.index('flat_snake')
+
+    @property
+    def osd_interval(self) -> int:
+        return SLOW_OSD_INTERVAL if self.level >= QUALITY_LEVELS.index('slow_osd') else 1
+
+    def telemetry(self) -> dict:
+        return {
+            'level': self.level,
+            'quality': QUALITY_LEVELS[self.level],
+            'changes': self.changes,
+            'budget_ms': self.budget_ms,
+            **self.frame_stats.summary(),
+        }
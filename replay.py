@@ -0,0 +1,55 @@
+import json
+from typing import Dict, List, Optional, Tuple
+
+REPLAY_DIR = 'replays'
+
+
+class Replay:
+    """Inputs of one game keyed by frame, enough to re-run it deterministically."""
+
+    def __init__(self, seed: int, base_speed: int, level: Optional[str] = None):
+        self.seed = seed
+        self.base_speed = base_speed
+        self.level = level  # Path of the level file, None for the empty board
+        self.frames = 0  # Number of Game.update calls the game lasted
+        self.events: Dict[int, List[Tuple[str, object]]] = {}
+
+    def add(self, frame: int, kind: str, value):
+        self.events.setdefault(frame, []).append((kind, value))
+
+    def truncate(self, frame: int):
+        # Forget inputs from this frame on, e.g. after the player rewinds
+        for key in [key for key in self.events if key >= frame]:
+            del self.events[key]
+
+    def events_at(self, frame: int) -> List[Tuple[str, object]]:
+        return self.events.get(frame, [])
+
+    def to_dict(self) -> dict:
+        return {
+            'seed': self.seed,
+            'base_speed': self.base_speed,
+            'frames': self.frames,
+            'level': self.level,
+            'events': [[frame, kind, value]
+                       for frame, events in sorted(self.events.items())
+                       for kind, value in events],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Replay':
+        replay = cls(data['seed'], data['base_speed'], data.get('level'))
+        replay.frames = data['frames']
+        for frame, kind, value in data['events']:
+            # JSON turns direction tuples into lists
+            replay.add(frame, kind, tuple(value) if isinstance(value, list) else value)
+        return replay
+
+    def save(self, path: str):
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path: str) -> 'Replay':
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
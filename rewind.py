@@ -0,0 +1,66 @@
+import collections
+
+REWIND_TICKS = 600  # 10 seconds of play at 60 FPS
+KEYFRAME_INTERVAL = 30
+
+
+class RewindBuffer:
+    """Fixed-size ring of keyframes every K ticks plus per-tick inputs in between.
+
+    The game object must provide snapshot(), restore(state), perform_input(kind,
+    value), step() and a frame_index tick counter.
+    """
+
+    def __init__(self, capacity: int = REWIND_TICKS, keyframe_interval: int = KEYFRAME_INTERVAL):
+        self.keyframe_interval = keyframe_interval
+        self.keyframes = collections.deque(maxlen=capacity // keyframe_interval + 1)
+        self.inputs = collections.deque(maxlen=capacity)
+        self.pending = []
+
+    def reset(self, game):
+        self.keyframes.clear()
+        self.inputs.clear()
+        self.pending = []
+        self.keyframes.append((game.frame_index, game.snapshot()))
+
+    def add_input(self, kind: str, value):
+        self.pending.append((kind, value))
+
+    def push(self, game):
+        # Called after each tick: inputs of the tick just played, then a
+        # keyframe of the resulting state every K ticks
+        self.inputs.append(tuple(self.pending))
+        self.pending = []
+        if game.frame_index % self.keyframe_interval == 0:
+            self.keyframes.append((game.frame_index, game.snapshot()))
+
+    def earliest_tick(self, game) -> int:
+        first_input = game.frame_index - len(self.inputs)
+        for tick, _ in self.keyframes:
+            if tick >= first_input:
+                return tick
+        return game.frame_index
+
+    def rewind(self, game, ticks: int) -> int:
+        target = max(game.frame_index - ticks, self.earliest_tick(game))
+        if target >= game.frame_index:
+            return 0
+        rewound = game.frame_index - target
+
+        # Drop the future: keyframes after the target and the inputs of every
+        # tick from the target on
+        while self.keyframes[-1][0] > target:
+            self.keyframes.pop()
+        for _ in range(rewound):
+            self.inputs.pop()
+        self.pending = []
+
+        # Restore the nearest keyframe and replay at most K ticks of input
+        tick, state = self.keyframes[-1]
+        game.restore(state)
+        offset = len(self.inputs) - (target - tick)
+        for i in range(target - tick):
+            for kind, value in self.inputs[offset + i]:
+                game.perform_input(kind, value)
+            game.step()
+        return rewound
@@ -0,0 +1,180 @@
+import json
+import queue
+import sqlite3
+import sys
+import threading
+import time
+from typing import List, Optional, Tuple
+
+SCORES_PATH = 'scores.db'
+BROWSER_STORAGE_KEY = 'python-snake.scores'
+BROWSER_MAX_ROWS = 100  # localStorage is small, only keep the leaderboard
+
+# Frame times above this land in the last histogram bucket
+FRAME_HISTOGRAM_MS = 250
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    score INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    duration REAL NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_scores_score ON scores (score DESC, id);
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    score_id INTEGER REFERENCES scores (id),
+    frames INTEGER NOT NULL,
+    mean_ms REAL NOT NULL,
+    p50_ms REAL NOT NULL,
+    p99_ms REAL NOT NULL,
+    max_ms REAL NOT NULL
+);
+'''
+
+
+class FrameStats:
+    """Constant-memory frame time summary (1 ms histogram buckets)."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.buckets = [0] * (FRAME_HISTOGRAM_MS + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, frame_ms: float):
+        self.buckets[min(int(frame_ms), FRAME_HISTOGRAM_MS)] += 1
+        self.count += 1
+        self.total_ms += frame_ms
+        self.max_ms = max(self.max_ms, frame_ms)
+
+    def percentile(self, pct: float) -> float:
+        if self.count == 0:
+            return 0.0
+        target = self.count * pct / 100
+        seen = 0
+        for ms, hits in enumerate(self.buckets):
+            seen += hits
+            if seen >= target:
+                return float(ms)
+        return float(FRAME_HISTOGRAM_MS)
+
+    def summary(self) -> dict:
+        return {
+            'frames': self.count,
+            'mean_ms': self.total_ms / self.count if self.count else 0.0,
+            'p50_ms': self.percentile(50),
+            'p99_ms': self.percentile(99),
+            'max_ms': self.max_ms,
+        }
+
+
+class ScoreStore:
+    """SQLite score store; writes are queued to a background thread."""
+
+    def __init__(self, path: str = SCORES_PATH):
+        self.path = path
+        self.queue = queue.Queue()
+        self.writer = None
+
+    def record_game(self, score: int, length: int, duration: float,
+                    frame_stats: Optional[dict] = None):
+        if self.writer is None:
+            self.writer = threading.Thread(target=self._write_loop, daemon=True)
+            self.writer.start()
+        self.queue.put((score, length, duration, time.time(), frame_stats))
+
+    def top_scores(self, n: int = 10) -> List[Tuple[int, int, float]]:
+        conn = self._connect()
+        try:
+            return conn.execute(
+                'SELECT score, length, duration FROM scores '
+                'ORDER BY score DESC, id LIMIT ?', (n,)).fetchall()
+        finally:
+            conn.close()
+
+    def flush(self):
+        self.queue.join()
+
+    def close(self):
+        if self.writer is not None:
+            self.queue.put(None)
+            self.writer.join()
+            self.writer = None
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path)
+        conn.executescript(SCHEMA)
+        return conn
+
+    def _write_loop(self):
+        conn = self._connect()
+        running = True
+        while running:
+            # Block for one entry, then drain whatever else queued up so a
+            # burst of game overs lands in a single transaction
+            batch = [self.queue.get()]
+            while True:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            with conn:
+                for entry in batch:
+                    if entry is None:
+                        running = False
+                        continue
+                    self._insert(conn, *entry)
+            for _ in batch:
+                self.queue.task_done()
+        conn.close()
+
+    def _insert(self, conn, score, length, duration, created_at, frame_stats):
+        cur = conn.execute(
+            'INSERT INTO scores (score, length, duration, created_at) '
+            'VALUES (?, ?, ?, ?)', (score, length, duration, created_at))
+        if frame_stats:
+            conn.execute(
+                'INSERT INTO sessions (score_id, frames, mean_ms, p50_ms, p99_ms, max_ms) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (cur.lastrowid, frame_stats['frames'], frame_stats['mean_ms'],
+                 frame_stats['p50_ms'], frame_stats['p99_ms'], frame_stats['max_ms']))
+
+
+class BrowserScoreStore:
+    """localStorage stand-in for the pygbag build (no threads or sqlite file)."""
+
+    def __init__(self, key: str = BROWSER_STORAGE_KEY):
+        import platform  # pygbag exposes the JS window here
+        self.storage = platform.window.localStorage
+        self.key = key
+
+    def _load(self) -> list:
+        raw = self.storage.getItem(self.key)
+        return json.loads(raw) if raw else []
+
+    def record_game(self, score: int, length: int, duration: float,
+                    frame_stats: Optional[dict] = None):
+        rows = self._load()
+        rows.append([score, length, duration])
+        rows.sort(key=lambda row: -row[0])
+        self.storage.setItem(self.key, json.dumps(rows[:BROWSER_MAX_ROWS]))
+
+    def top_scores(self, n: int = 10) -> List[Tuple[int, int, float]]:
+        return [tuple(row) for row in self._load()[:n]]
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def open_score_store():
+    if sys.platform == 'emscripten':
+        return BrowserScoreStore()
+    return ScoreStore()
@@ -0,0 +1,156 @@
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+from typing import List, Optional
+
+# Run headless; must be set before pygame is initialised by game.py
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+from game import Game
+from bot import BotRunner, GreedyBot, DIRECTIONS
+
+SOAK_TICKS = 100_000
+SAMPLE_EVERY = 1000      # Ticks per sample window
+WARMUP_WINDOWS = 2       # Windows skipped before taking the baseline, caches fill up here
+COMPARE_WINDOWS = 3      # Windows at the end compared against the baseline
+MAX_MEMORY_GROWTH_MB = 5.0
+MAX_RSS_GROWTH_MB = 20.0
+MAX_P99_GROWTH = 1.5     # Allowed ratio of final to baseline p99 frame time
+P99_NOISE_MS = 1.0       # p99 growth below this is never a failure
+RANDOM_TURN_CHANCE = 0.05
+
+
+def rss_bytes() -> Optional[int]:
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def run_soak(ticks: int = SOAK_TICKS, sample_every: int = SAMPLE_EVERY, autopilot: bool = True,
+             seed: int = 0, game: Game = None,
+             max_memory_growth_mb: float = MAX_MEMORY_GROWTH_MB,
+             max_rss_growth_mb: float = MAX_RSS_GROWTH_MB,
+             max_p99_growth: float = MAX_P99_GROWTH, verbose: bool = False) -> dict:
+    """Run the full game loop headless and check memory and frame times stay flat."""
+    rng = random.Random(seed)
+    bot_runner = BotRunner(GreedyBot()) if autopilot else None
+    if game is None:
+        # Nothing written to the score store or replays directory
+        game = Game(record=False, bot_runner=bot_runner)
+    else:
+        game.bot_runner = bot_runner
+    game.start_game(seed)
+
+    tracemalloc.start()
+    samples = []
+    frame_times = []
+    games = 1
+    try:
+        for tick in range(1, ticks + 1):
+            start = time.perf_counter()
+            game.handle_events()
+            if not autopilot and rng.random() < RANDOM_TURN_CHANCE:
+                game.apply_input('turn', rng.choice(DIRECTIONS))
+            game.update()
+            game.draw()
+            game.clock.tick()
+            if game.game_over:
+                game.start_game(rng.getrandbits(32))
+                games += 1
+            frame_times.append((time.perf_counter() - start) * 1000)
+
+            if tick % sample_every == 0:
+                gc.collect()
+                samples.append({
+                    'tick': tick,
+                    'traced_bytes': tracemalloc.get_traced_memory()[0],
+                    'rss_bytes': rss_bytes(),
+                    'p50_ms': percentile(frame_times, 50),
+                    'p99_ms': percentile(frame_times, 99),
+                    'max_ms': max(frame_times),
+                })
+                frame_times = []
+                if verbose:
+                    sample = samples[-1]
+                    print(f"tick {sample['tick']:>8}  traced {sample['traced_bytes'] / 2**20:8.2f} MB  "
+                          f"p50 {sample['p50_ms']:6.2f} ms  p99 {sample['p99_ms']:6.2f} ms")
+    finally:
+        tracemalloc.stop()
+        if bot_runner:
+            bot_runner.close()
+
+    return check_samples(samples, games, max_memory_growth_mb, max_rss_growth_mb, max_p99_growth,
+                         bot_runner.stats() if bot_runner else None)
+
+
+def check_samples(samples: List[dict], games: int, max_memory_growth_mb: float,
+                  max_rss_growth_mb: float, max_p99_growth: float, bot_stats: dict = None) -> dict:
+    report = {'samples': samples, 'games': games, 'bot': bot_stats, 'failures': []}
+    if len(samples) < WARMUP_WINDOWS + 2:
+        report['failures'].append(f'need at least {WARMUP_WINDOWS + 2} sample windows')
+        return report
+
+    baseline = samples[WARMUP_WINDOWS]
+    final = samples[-1]
+    report['memory_growth_mb'] = (final['traced_bytes'] - baseline['traced_bytes']) / 2**20
+    if report['memory_growth_mb'] > max_memory_growth_mb:
+        report['failures'].append(f"traced memory grew {report['memory_growth_mb']:.2f} MB "
+                                  f"(limit {max_memory_growth_mb} MB)")
+
+    if final['rss_bytes'] is not None and baseline['rss_bytes'] is not None:
+        report['rss_growth_mb'] = (final['rss_bytes'] - baseline['rss_bytes']) / 2**20
+        if report['rss_growth_mb'] > max_rss_growth_mb:
+            report['failures'].append(f"RSS grew {report['rss_growth_mb']:.2f} MB "
+                                      f"(limit {max_rss_growth_mb} MB)")
+
+    # The best of the last few windows, so one noisy window doesn't fail the
+    # run but a slow degradation still does
+    tail = samples[max(WARMUP_WINDOWS + 1, len(samples) - COMPARE_WINDOWS):]
+    final_p99 = min(sample['p99_ms'] for sample in tail)
+    report['p99_growth'] = final_p99 / baseline['p99_ms'] if baseline['p99_ms'] else 1.0
+    if report['p99_growth'] > max_p99_growth and final_p99 - baseline['p99_ms'] > P99_NOISE_MS:
+        report['failures'].append(f"p99 frame time went from {baseline['p99_ms']:.2f} ms "
+                                  f"to {final_p99:.2f} ms (limit x{max_p99_growth})")
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the game headless for a long time and '
+                                                 'fail on memory growth or frame time drift')
+    parser.add_argument('--ticks', type=int, default=SOAK_TICKS)
+    parser.add_argument('--sample-every', type=int, default=SAMPLE_EVERY)
+    parser.add_argument('--input', choices=['autopilot', 'random'], default='autopilot')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--max-memory-growth-mb', type=float, default=MAX_MEMORY_GROWTH_MB)
+    parser.add_argument('--max-rss-growth-mb', type=float, default=MAX_RSS_GROWTH_MB)
+    parser.add_argument('--max-p99-growth', type=float, default=MAX_P99_GROWTH)
+    args = parser.parse_args()
+
+    report = run_soak(args.ticks, args.sample_every, args.input == 'autopilot', args.seed,
+                      max_memory_growth_mb=args.max_memory_growth_mb,
+                      max_rss_growth_mb=args.max_rss_growth_mb,
+                      max_p99_growth=args.max_p99_growth, verbose=True)
+    print(f"games played: {report['games']}")
+    if report['bot']:
+        print(f"bot decisions: {report['bot']['decisions']}, missed: {report['bot']['missed']}")
+    for key in ('memory_growth_mb', 'rss_growth_mb', 'p99_growth'):
+        if key in report:
+            print(f'{key}: {report[key]:.2f}')
+    for failure in report['failures']:
+        print(f'FAIL: {failure}')
+    sys.exit(1 if report['failures'] else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+import argparse
+import os
+import struct
+from multiprocessing import resource_tracker, shared_memory
+from typing import Optional, Tuple
+
+import pygame
+
+SPECTATOR_NAME = 'python-snake'
+SPECTATOR_SLOTS = 3
+
+# Shared memory layout:
+#   header   latest sequence number, width, height, slot count
+#   slots    slot count * (sequence number, RGBX pixels)
+# A slot's sequence number is zeroed while it is being written, so a reader
+# that sees the same non-zero number before and after copying got a whole frame.
+HEADER = struct.Struct('<QIII')
+SLOT_HEADER = struct.Struct('<Q')
+
+
+class FramePublisher:
+    """Ring of frames in shared memory; publishing is one blit whatever the viewer count."""
+
+    def __init__(self, size: Tuple[int, int], name: str = SPECTATOR_NAME,
+                 slots: int = SPECTATOR_SLOTS):
+        self.size = size
+        self.slots = slots
+        self.frame_bytes = size[0] * size[1] * 4
+        self.slot_bytes = SLOT_HEADER.size + self.frame_bytes
+        self.shm = shared_memory.SharedMemory(name=name, create=True,
+                                              size=HEADER.size + slots * self.slot_bytes)
+        self.seq = 0
+        HEADER.pack_into(self.shm.buf, 0, self.seq, size[0], size[1], slots)
+
+        # Surfaces drawn straight into the shared slots
+        self.slot_surfaces = []
+        for slot in range(slots):
+            start = self.slot_offset(slot) + SLOT_HEADER.size
+            pixels = self.shm.buf[start:start + self.frame_bytes]
+            self.slot_surfaces.append(pygame.image.frombuffer(pixels, size, 'RGBX'))
+
+    def slot_offset(self, slot: int) -> int:
+        return HEADER.size + slot * self.slot_bytes
+
+    def publish(self, surface: pygame.Surface):
+        self.seq += 1
+        slot = self.seq % self.slots
+        offset = self.slot_offset(slot)
+        SLOT_HEADER.pack_into(self.shm.buf, offset, 0)
+        self.slot_surfaces[slot].blit(surface, (0, 0))
+        SLOT_HEADER.pack_into(self.shm.buf, offset, self.seq)
+        HEADER.pack_into(self.shm.buf, 0, self.seq, self.size[0], self.size[1], self.slots)
+
+    def close(self):
+        # Surfaces hold exports of the buffer, which must go before closing
+        self.slot_surfaces = []
+        self.shm.close()
+        self.shm.unlink()
+
+
+class FrameSubscriber:
+    """Reads the newest frame; see main() for attaching from an unrelated process."""
+
+    def __init__(self, name: str = SPECTATOR_NAME):
+        self.shm = shared_memory.SharedMemory(name=name)
+        _, width, height, self.slots = HEADER.unpack_from(self.shm.buf, 0)
+        self.size = (width, height)
+        self.frame_bytes = width * height * 4
+        self.slot_bytes = SLOT_HEADER.size + self.frame_bytes
+        self.last_seq = 0
+
+    def latest(self) -> Optional[Tuple[int, bytes]]:
+        # Newest whole frame as (sequence number, RGBX bytes), None if nothing new
+        while True:
+            seq = HEADER.unpack_from(self.shm.buf, 0)[0]
+            if seq == self.last_seq:
+                return None
+            offset = HEADER.size + (seq % self.slots) * self.slot_bytes
+            start = offset + SLOT_HEADER.size
+            frame = bytes(self.shm.buf[start:start + self.frame_bytes])
+            if SLOT_HEADER.unpack_from(self.shm.buf, offset)[0] == seq:
+                self.last_seq = seq
+                return seq, frame
+
+    def close(self):
+        self.shm.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Watch a running game')
+    parser.add_argument('--name', default=SPECTATOR_NAME)
+    parser.add_argument('--record', help='directory to save every received frame as PNG')
+    args = parser.parse_args()
+
+    pygame.init()
+    subscriber = FrameSubscriber(args.name)
+    # Attaching registers the segment with this process's own resource
+    # tracker, which would unlink it under the running game on exit
+    resource_tracker.unregister(subscriber.shm._name, 'shared_memory')
+    screen = pygame.display.set_mode(subscriber.size)
+    pygame.display.set_caption('Snake Game - Spectator')
+    clock = pygame.time.Clock()
+    if args.record:
+        os.makedirs(args.record, exist_ok=True)
+
+    running = True
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+        latest = subscriber.latest()
+        if latest:
+            seq, frame = latest
+            surface = pygame.image.frombuffer(frame, subscriber.size, 'RGBX')
+            screen.blit(surface, (0, 0))
+            pygame.display.flip()
+            if args.record:
+                pygame.image.save(surface, os.path.join(args.record, f'frame_{seq:08d}.png'))
+        clock.tick(60)
+
+    subscriber.close()
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+import threading
+from concurrent.futures import ProcessPoolExecutor
+import pytest
+from game import Game
+from bot import Bot, BotRunner, BoardView, GreedyBot
+
+class SlowBot(Bot):
+    name = 'slow'
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def decide(self, view):
+        self.release.wait(5)
+        return (0, 1)
+
+def test_greedy_bot_heads_for_food():
+    view = BoardView(10, 10, ((5, 5), (4, 5)), (1, 0), (5, 2), 0)
+    assert GreedyBot().decide(view) == (0, -1)
+
+def test_greedy_bot_avoids_walls():
+    walls = bytearray(13)
+    i = 5 * 10 + 6  # Wall right in front of the head
+    walls[i >> 3] |= 1 << (i & 7)
+    view = BoardView(10, 10, ((5, 5), (4, 5)), (1, 0), (9, 5), 0, bytes(walls))
+    assert GreedyBot().decide(view) in ((0, 1), (0, -1))
+
+def test_slow_bot_never_stalls_the_game():
+    bot = SlowBot()
+    runner = BotRunner(bot)
+    game = Game(record=False, bot_runner=runner)
+    game.start_game(seed=9)
+    start = game.snake.get_head_position()
+    for _ in range(20):
+        game.update()
+    # No decision arrived, so the snake kept moving right
+    assert game.snake.direction == (1, 0)
+    assert game.snake.get_head_position()[0] != start[0]
+    assert runner.missed > 0
+    assert runner.decisions == 0
+    bot.release.set()
+    runner.close()
+
+def test_bot_steers_the_game():
+    runner = BotRunner(GreedyBot())
+    game = Game(record=False, bot_runner=runner)
+    game.start_game(seed=11)
+    runner.future.result()  # Let the first decision land before the move
+    for _ in range(300):
+        if runner.future is not None:
+            runner.future.result()
+        game.update()
+    assert game.score > 0
+    stats = runner.stats()
+    assert stats['bot'] == 'greedy'
+    assert stats['decisions'] > 0
+    assert stats['missed'] == 0
+    assert stats['latency_ms']['frames'] == stats['decisions']
+    runner.close()
+
+def test_bot_in_process_pool():
+    runner = BotRunner(GreedyBot(), ProcessPoolExecutor(max_workers=1))
+    view = BoardView(10, 10, ((5, 5),), (1, 0), (5, 8), 0)
+    runner.request(view)
+    runner.future.result(timeout=10)
+    assert runner.poll() == (0, 1)
+    runner.close()
@@ -0,0 +1,39 @@
+import os
+import pytest
+from game import Game
+from replay import Replay
+from export import render_chunk, export_replay
+
+def record_short_game(frames=40):
+    game = Game(record=False)
+    game.start_game(seed=1234)
+    for frame in range(frames):
+        if frame == 10:
+            game.apply_input('turn', (0, 1))
+        if frame == 20:
+            game.apply_input('theme', 1)
+        game.update()
+    game.replay.frames = game.frame_index
+    return game.replay
+
+def test_replay_round_trip(tmp_path):
+    replay = record_short_game()
+    path = str(tmp_path / 'replay.json')
+    replay.save(path)
+
+    loaded = Replay.load(path)
+    assert loaded.to_dict() == replay.to_dict()
+    assert loaded.events_at(10) == [('turn', (0, 1))]
+
+def test_render_chunks_match_full_render():
+    replay = record_short_game()
+    full = render_chunk(replay, 0, 30, scale=0.25)
+    tail = render_chunk(replay, 20, 30, scale=0.25)
+    assert len(full) == 30
+    assert full[20:] == tail
+
+def test_export_png_frames(tmp_path):
+    replay = record_short_game()
+    out = str(tmp_path / 'frames')
+    export_replay(replay, out, processes=2, chunk_frames=8, scale=0.25)
+    assert len(os.listdir(out)) == replay.frames
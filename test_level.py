@@ -0,0 +1,66 @@
+import pytest
+from game import Snake, Food, Game, GRID_WIDTH, GRID_HEIGHT
+from level import Level
+
+def test_level_round_trip(tmp_path):
+    level = Level.from_cells(GRID_WIDTH, GRID_HEIGHT, [(0, 0), (5, 3), (39, 29)],
+                             [((1, 1), (30, 20))])
+    path = str(tmp_path / 'level.lvl')
+    level.save(path)
+
+    loaded = Level.load(path)
+    assert (loaded.width, loaded.height) == (GRID_WIDTH, GRID_HEIGHT)
+    assert loaded.is_wall((5, 3)) and loaded.is_wall((39, 29))
+    assert not loaded.is_wall((4, 3))
+    assert loaded.portals == {(1, 1): (30, 20), (30, 20): (1, 1)}
+
+def test_large_level_load(tmp_path):
+    walls = [(x, x) for x in range(1000)]
+    path = str(tmp_path / 'big.lvl')
+    Level.from_cells(1000, 1000, walls).save(path)
+
+    level = Level.load(path)
+    assert level.is_wall((999, 999))
+    assert not level.is_wall((998, 999))
+
+def test_level_from_text():
+    level = Level.from_text('#..a\n.#..\na..#')
+    assert level.is_wall((0, 0)) and level.is_wall((1, 1)) and level.is_wall((3, 2))
+    assert level.portals[(3, 0)] == (0, 2)
+
+def test_snake_hits_wall():
+    head = (GRID_WIDTH // 2, GRID_HEIGHT // 2)
+    level = Level.from_cells(GRID_WIDTH, GRID_HEIGHT, [(head[0] + 2, head[1])])
+    snake = Snake(level)
+    assert snake.move() == True
+    assert snake.move() == False
+
+def test_snake_through_portal():
+    head = (GRID_WIDTH // 2, GRID_HEIGHT // 2)
+    level = Level.from_cells(GRID_WIDTH, GRID_HEIGHT, [], [((head[0] + 1, head[1]), (2, 2))])
+    snake = Snake(level)
+    assert snake.move() == True
+    assert snake.get_head_position() == (2, 2)
+    assert snake.move() == True
+    assert snake.get_head_position() == (3, 2)
+
+def test_food_avoids_walls():
+    free = (7, 7)
+    walls = [(x, y) for x in range(GRID_WIDTH) for y in range(GRID_HEIGHT)
+             if (x, y) != free and (x, y) != (8, 7)]
+    level = Level.from_cells(GRID_WIDTH, GRID_HEIGHT, walls)
+    food = Food(level)
+    food.randomize_position([(8, 7)])
+    assert food.position == free
+
+def test_game_rejects_wrong_level_size():
+    with pytest.raises(ValueError):
+        Game(level=Level.from_cells(10, 10, []))
+
+def test_game_draws_level():
+    level = Level.from_cells(GRID_WIDTH, GRID_HEIGHT, [(0, 0), (1, 0)], [((3, 3), (9, 9))])
+    game = Game(record=False, level=level)
+    game.start_game(seed=1)
+    game.draw()
+    game.draw()
+    assert len(level.wall_layers) == 1
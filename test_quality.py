@@ -0,0 +1,50 @@
+import pytest
+from game import Game
+from quality import QualityGovernor, QUALITY_LEVELS, DEGRADE_AFTER, RESTORE_AFTER, SLOW_OSD_INTERVAL
+
+def test_governor_degrades_step_by_step():
+    governor = QualityGovernor(16.0)
+    for _ in range(DEGRADE_AFTER - 1):
+        governor.add(30)
+    assert governor.level == 0
+
+    governor.add(30)
+    assert governor.level == 1
+    assert not governor.show_grid and governor.rounded_snake
+
+    for _ in range(DEGRADE_AFTER * 10):
+        governor.add(30)
+    assert governor.level == len(QUALITY_LEVELS) - 1
+    assert not governor.rounded_snake
+    assert governor.osd_interval == SLOW_OSD_INTERVAL
+
+def test_governor_restores_with_hysteresis():
+    governor = QualityGovernor(16.0)
+    for _ in range(DEGRADE_AFTER):
+        governor.add(30)
+    assert governor.level == 1
+
+    # Frames just under budget are not headroom
+    for _ in range(RESTORE_AFTER * 2):
+        governor.add(15)
+    assert governor.level == 1
+
+    for _ in range(RESTORE_AFTER):
+        governor.add(2)
+    assert governor.level == 0
+
+    telemetry = governor.telemetry()
+    assert telemetry['quality'] == 'full'
+    assert telemetry['changes'] == 2
+    assert telemetry['frames'] == DEGRADE_AFTER + RESTORE_AFTER * 3
+
+def test_game_draws_at_every_quality_level():
+    game = Game(record=False)
+    game.start_game(seed=5)
+    for _ in range(30):
+        game.update()
+    for level in range(len(QUALITY_LEVELS)):
+        game.quality.level = level
+        for _ in range(3):
+            game.draw_game_screen()
+    assert game.osd_surface is not None
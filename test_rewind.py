@@ -0,0 +1,51 @@
+import pytest
+from game import Game
+from rewind import RewindBuffer
+
+def play(game, frames, turns):
+    states = [game.snapshot()]
+    for _ in range(frames):
+        if game.frame_index in turns:
+            game.apply_input('turn', turns[game.frame_index])
+        game.update()
+        states.append(game.snapshot())
+    return states
+
+def test_rewind_restores_earlier_tick():
+    game = Game(record=False)
+    game.start_game(seed=42)
+    states = play(game, 100, {12: (0, 1), 47: (-1, 0), 80: (0, -1)})
+
+    for ticks in (1, 7, 30, 31):
+        target = game.frame_index - ticks
+        assert game.rewind(ticks) == ticks
+        assert game.snapshot() == states[target]
+        states = states[:target + 1]
+
+def test_rewind_then_replay_matches_recording():
+    game = Game(record=False)
+    game.start_game(seed=7)
+    play(game, 60, {5: (0, 1), 40: (1, 0)})
+    game.rewind(25)
+    play(game, 25, {40: (1, 0)})
+    assert all(frame < 60 for frame in game.replay.events)
+
+    fresh = Game(record=False)
+    fresh.start_game(seed=7)
+    for frame in range(game.frame_index):
+        for kind, value in game.replay.events_at(frame):
+            fresh.apply_input(kind, value)
+        fresh.update()
+    assert fresh.snapshot() == game.snapshot()
+
+def test_rewind_memory_is_bounded():
+    game = Game(record=False)
+    game.rewind_buffer = RewindBuffer(capacity=60, keyframe_interval=10)
+    game.start_game(seed=3)
+    play(game, 500, {})
+
+    assert len(game.rewind_buffer.inputs) == 60
+    assert len(game.rewind_buffer.keyframes) <= 7
+    # Only the last 60 ticks can be reached
+    assert game.rewind(1000) == 60
+    assert game.rewind(1) == 0
@@ -0,0 +1,39 @@
+import pytest
+from scores import ScoreStore, FrameStats
+
+def test_score_store_top_scores(tmp_path):
+    store = ScoreStore(str(tmp_path / 'scores.db'))
+    for score in (5, 12, 1, 8):
+        store.record_game(score, score + 3, 10.0)
+    store.flush()
+
+    top = store.top_scores(3)
+    assert [row[0] for row in top] == [12, 8, 5]
+    assert top[0] == (12, 15, 10.0)
+    store.close()
+
+def test_score_store_session_stats(tmp_path):
+    store = ScoreStore(str(tmp_path / 'scores.db'))
+    stats = FrameStats()
+    for ms in (16, 16, 17, 40):
+        stats.add(ms)
+    store.record_game(3, 6, 4.5, stats.summary())
+    store.close()
+
+    conn = store._connect()
+    row = conn.execute('SELECT frames, max_ms FROM sessions').fetchone()
+    conn.close()
+    assert row == (4, 40.0)
+
+def test_frame_stats_percentiles():
+    stats = FrameStats()
+    for _ in range(99):
+        stats.add(16)
+    stats.add(500)  # Clamped into the last bucket
+
+    summary = stats.summary()
+    assert summary['frames'] == 100
+    assert summary['p50_ms'] == 16
+    assert summary['p99_ms'] == 16
+    assert summary['max_ms'] == 500
+    assert stats.percentile(100) == 250
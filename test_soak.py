@@ -0,0 +1,34 @@
+import pytest
+from game import Game
+from soak import run_soak, check_samples
+
+class LeakyGame(Game):
+    def __init__(self):
+        super().__init__(record=False)
+        self.leak = []
+
+    def draw(self):
+        super().draw()
+        self.leak.append(bytearray(10_000))
+
+def test_soak_short_run_passes():
+    report = run_soak(ticks=600, sample_every=100, max_p99_growth=100)
+    assert report['failures'] == []
+    assert len(report['samples']) == 6
+    assert report['bot']['decisions'] > 0
+
+def test_soak_random_input():
+    report = run_soak(ticks=400, sample_every=100, autopilot=False, max_p99_growth=100)
+    assert report['failures'] == []
+    assert report['bot'] is None
+
+def test_soak_detects_memory_growth():
+    report = run_soak(ticks=600, sample_every=100, game=LeakyGame(),
+                      max_memory_growth_mb=1, max_rss_growth_mb=1000, max_p99_growth=100)
+    assert any('traced memory' in failure for failure in report['failures'])
+
+def test_soak_detects_p99_growth():
+    samples = [{'tick': i, 'traced_bytes': 0, 'rss_bytes': None, 'p50_ms': 2,
+                'p99_ms': 4 + i * 2, 'max_ms': 10} for i in range(8)]
+    report = check_samples(samples, 1, 5, 20, 1.5)
+    assert any('p99' in failure for failure in report['failures'])
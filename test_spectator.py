@@ -0,0 +1,44 @@
+import multiprocessing
+import os
+import pygame
+import pytest
+from game import Game, WINDOW_WIDTH, WINDOW_HEIGHT
+from spectator import FrameSubscriber
+
+def read_in_viewer(name, results):
+    subscriber = FrameSubscriber(name)
+    latest = subscriber.latest()
+    results.put((latest[0], latest[1][:4], subscriber.size))
+    subscriber.close()
+
+def test_publish_and_subscribe():
+    name = f'snake-test-{os.getpid()}'
+    game = Game(record=False, spectator_name=name)
+    try:
+        subscriber = FrameSubscriber(name)
+        assert subscriber.latest() is None
+
+        game.screen.fill((10, 20, 30))
+        game.present()
+        seq, frame = subscriber.latest()
+        assert seq == 1
+        assert len(frame) == WINDOW_WIDTH * WINDOW_HEIGHT * 4
+        assert frame[:3] == bytes((10, 20, 30))
+        assert subscriber.latest() is None  # Nothing new yet
+
+        for _ in range(5):
+            game.present()
+        assert subscriber.latest()[0] == 6
+
+        # Other processes see the same frames
+        results = multiprocessing.Queue()
+        viewer = multiprocessing.Process(target=read_in_viewer, args=(name, results))
+        viewer.start()
+        seq, pixel, size = results.get(timeout=10)
+        viewer.join()
+        assert seq == 6
+        assert pixel[:3] == bytes((10, 20, 30))
+        assert size == (WINDOW_WIDTH, WINDOW_HEIGHT)
+        subscriber.close()
+    finally:
+        game.publisher.close()